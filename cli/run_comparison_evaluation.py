@@ -202,10 +202,10 @@ async def run_comparison(args) -> bool:
     all_results = []
     
     for rate in args.failure_rates:
-        logger.info(f"\n📊 Chaos Rate: {rate:.0%}")
+        logger.info("\n📊 Chaos Rate: %.0f%%", rate * 100)
         
         # Agent A
-        logger.info(f"  👉 Testing Agent A: {args.agent_a_label}")
+        logger.info("  👉 Testing Agent A: %s", args.agent_a_label)
         for i in range(args.experiments_per_rate):
             seed = (args.seed or 42) + i
             res = await run_single_eval_case(f"A-{rate:.2f}-{i+1:03d}", args.playbook_a, rate, seed, args.verbose)
@@ -214,7 +214,7 @@ async def run_comparison(args) -> bool:
             print(f"     Run {i+1}: {res['outcome'].upper()} (Score: {res['adk_score']:.2f})")
 
         # Agent B
-        logger.info(f"  👉 Testing Agent B: {args.agent_b_label}")
+        logger.info("  👉 Testing Agent B: %s", args.agent_b_label)
         for i in range(args.experiments_per_rate):
             seed = (args.seed or 42) + i
             res = await run_single_eval_case(f"B-{rate:.2f}-{i+1:03d}", args.playbook_b, rate, seed, args.verbose)
@@ -249,7 +249,7 @@ def save_results(results, output_dir, logger):
     with open(json_path, "w") as f:
         json.dump(agg_data, f, indent=2)
 
-    logger.info(f"\n✅ Results saved to: {output_dir}")
+    logger.info("\n✅ Results saved to: %s", output_dir)
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Run comparison using ADK Evaluator")
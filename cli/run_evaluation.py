@@ -4,7 +4,6 @@ CLI entry point for Agent Evaluation with Observability.
 from __future__ import annotations
 
 import sys
-import asyncio
 import argparse
 import json
 from pathlib import Path
@@ -19,12 +18,17 @@ if str(src_path) not in sys.path:
 
 from chaos_engine.evaluation.runner import EvaluationRunner
 from chaos_engine.core.logging import setup_logger
+from chaos_engine.core.runtime import run_async
 
 async def main():
     parser = argparse.ArgumentParser(description="Run Chaos Agent Evaluation Suite")
     parser.add_argument("--suite", type=str, default="assets/evaluations/test_suite.json")
     parser.add_argument("--playbook", type=str, default="assets/playbooks/training.json")
     parser.add_argument("--verbose", action="store_true", help="Show logs in console")
+    parser.add_argument(
+        "--max-concurrency", type=int, default=1,
+        help="Test cases run in parallel (default: 1; higher values risk LLM quota errors)"
+    )
     
     args = parser.parse_args()
     
@@ -41,7 +45,7 @@ async def main():
      
     logger.info("="*60)
     logger.info("🕵️‍♂️ AGENT QA EVALUATION STARTED")
-    logger.info(f"📁 Report Artifacts: {output_dir}")
+    logger.info("📁 Report Artifacts: %s", output_dir)
     logger.info("="*60)
 
     # Validate paths
@@ -52,18 +56,19 @@ async def main():
     if not Path(playbook_path).exists(): playbook_path = str(project_root / args.playbook)
 
     # 2. EXECUTE
-    runner = EvaluationRunner(agent_playbook=playbook_path)
+    runner = EvaluationRunner(agent_playbook=playbook_path, max_concurrency=args.max_concurrency)
     results = await runner.run_suite(str(suite_path))
     
     # 3. GENERATE JSON REPORT (Quality Artifact)
+    passed = sum(1 for r in results if r.passed)
     report = {
         "timestamp": timestamp,
         "suite": args.suite,
         "playbook": args.playbook,
         "summary": {
             "total": len(results),
-            "passed": sum(1 for r in results if r.passed),
-            "failed": sum(1 for r in results if not r.passed)
+            "passed": passed,
+            "failed": len(results) - passed
         },
         "results": [r.to_dict() for r in results]
     }
@@ -72,11 +77,11 @@ async def main():
     with open(json_path, 'w') as f:
         json.dump(report, f, indent=2)
         
-    logger.info(f"\n📊 REPORT SAVED: {json_path}")
-    logger.info(f"✅ PASSED: {report['summary']['passed']}/{report['summary']['total']}")
+    logger.info("\n📊 REPORT SAVED: %s", json_path)
+    logger.info("✅ PASSED: %d/%d", report['summary']['passed'], report['summary']['total'])
     
     if report['summary']['failed'] > 0:
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_async(main())
\ No newline at end of file
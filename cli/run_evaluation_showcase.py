@@ -66,7 +66,7 @@ async def run_showcase():
         json.dump(golden_case, tmp)
         tmp_path = tmp.name
 
-    logger.info(f"📂 Temporary dataset generated: {tmp_path}")
+    logger.info("📂 Temporary dataset generated: %s", tmp_path)
 
     # 3. Define the Network Mock (Network Simulator)
     # To evaluate TRACEABILITY, we need the agent not to fail due to network issues,
@@ -112,7 +112,7 @@ async def run_showcase():
                 )
                 
     except Exception as e:
-        logger.error(f"❌ Error during evaluation: {e}")
+        logger.error("❌ Error during evaluation: %s", e)
         raise e
     finally:
         # Cleanup
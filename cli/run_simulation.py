@@ -4,12 +4,12 @@ CLI script to run parametric experiments.
 from __future__ import annotations
 
 import sys
-import asyncio
 import argparse
 from pathlib import Path
 from datetime import datetime
 from chaos_engine.core.logging import setup_logger 
 from chaos_engine.simulation.parametric import ParametricABTestRunner
+from chaos_engine.core.runtime import run_async
 
 def main():
     parser = argparse.ArgumentParser(description="Run parametric chaos experiments")
@@ -55,7 +55,7 @@ def main():
     )
     
     
-    asyncio.run(runner.run_parametric_experiments())
+    run_async(runner.run_parametric_experiments())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,12 +10,13 @@ Usage::
 from __future__ import annotations
 
 import argparse
-import asyncio
 import signal
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from chaos_engine.core.runtime import run_async
+
 
 def _cmd_simulate(args: argparse.Namespace) -> None:
     """Run parametric chaos experiments."""
@@ -47,7 +48,7 @@ def _cmd_simulate(args: argparse.Namespace) -> None:
         agents=agents,
     )
 
-    result = asyncio.run(runner.run_parametric_experiments())
+    result = run_async(runner.run_parametric_experiments())
     logger.info("Done. Total experiments: %d", result["total_experiments"])
     print(f"Results saved to {output_dir}")
 
@@ -95,7 +96,7 @@ def _cmd_evolve(args: argparse.Namespace) -> None:
         output_dir=args.output_dir,
         mutation_rate=args.mutation_rate,
     )
-    best = asyncio.run(evolver.evolve(
+    best = run_async(evolver.evolve(
         generations=args.generations,
         variants_per_gen=args.variants,
     ))
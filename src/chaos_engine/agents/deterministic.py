@@ -8,12 +8,13 @@ infrastructure stack: ChaosProxy, CircuitBreakerProxy, and playbook lookup.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Final, Optional, Tuple
 
 from chaos_engine.core.protocols import Executor
+from chaos_engine.core.serialization import load_file_cached
 from chaos_engine.core.types import (
     ApiResponse,
     ExperimentResult,
@@ -35,6 +36,18 @@ WORKFLOW_STEPS: Final[tuple[
      None, {"id": 12345, "name": "MockPet", "status": "sold", "photoUrls": []}),
 )
 
+# Per-path (parsed playbook, int-keyed index). The playbook object comes from
+# load_file_cached, so an identity match means the file is unchanged and the
+# index can be shared by every agent built from it. Bounded LRU: the evolver
+# writes a new playbook file per variant.
+_STRATEGY_INDEX_CACHE: OrderedDict[str, Tuple[Dict, Dict[str, Dict[int, Dict[str, Any]]]]] = (
+    OrderedDict()
+)
+_STRATEGY_INDEX_CACHE_SIZE: Final[int] = 32
+
+# 2 ** (attempt - 1) for exponential backoff, precomputed for realistic retry counts
+_EXP_FACTORS: Final[tuple[int, ...]] = tuple(2 ** i for i in range(16))
+
 
 class DeterministicAgent:
     """
@@ -51,6 +64,7 @@ class DeterministicAgent:
     ):
         self.executor = tool_executor
         self.playbook_data = self._load_playbook(playbook_path)
+        self._strategy_index = self._get_strategy_index(playbook_path, self.playbook_data)
         self.verbose = verbose
         self.simulate_delays = simulate_delays
         self.logger = logging.getLogger("DeterministicAgent")
@@ -58,15 +72,42 @@ class DeterministicAgent:
     @staticmethod
     def _load_playbook(path: str) -> Dict:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_file_cached(path)
         except Exception:
             logging.getLogger("DeterministicAgent").warning("Error loading playbook %s", path, exc_info=True)
             return {}
 
+    @classmethod
+    def _get_strategy_index(
+        cls, path: str, playbook: Dict
+    ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """Reuse the index built for this exact parsed playbook by an earlier agent."""
+        cached = _STRATEGY_INDEX_CACHE.get(path)
+        if cached is not None and cached[0] is playbook:
+            _STRATEGY_INDEX_CACHE.move_to_end(path)
+            return cached[1]
+        index = cls._build_strategy_index(playbook)
+        _STRATEGY_INDEX_CACHE[path] = (playbook, index)
+        _STRATEGY_INDEX_CACHE.move_to_end(path)
+        if len(_STRATEGY_INDEX_CACHE) > _STRATEGY_INDEX_CACHE_SIZE:
+            _STRATEGY_INDEX_CACHE.popitem(last=False)
+        return index
+
+    @staticmethod
+    def _build_strategy_index(playbook: Dict) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """Re-key per-tool playbook entries by int status code, parsed once."""
+        index: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        for tool_name, tool_config in playbook.items():
+            if not isinstance(tool_config, dict):
+                continue
+            index[tool_name] = {
+                int(code): entry for code, entry in tool_config.items() if code.isdigit()
+            }
+        return index
+
     async def run(self) -> ExperimentResult:
         """Execute the 4-step workflow. Returns result compatible with ABTestRunner."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         steps_completed: list[str] = []
         failed_at: str | None = None
         total_retries = 0
@@ -85,7 +126,7 @@ class DeterministicAgent:
                 failed_at = step_name
                 break
 
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
         status = Status.SUCCESS if failed_at is None else Status.FAILURE
 
         return ExperimentResult(
@@ -111,7 +152,7 @@ class DeterministicAgent:
             return result, 0, 0.0
 
         # Error path — consult playbook
-        error_code = str(result.get("code", 500))
+        error_code = result.get("code", 500)
         strategy_entry = self._resolve_strategy(tool_name, error_code)
         strategy = strategy_entry.get("strategy", RetryStrategy.FAIL_FAST)
         config = strategy_entry.get("config", {})
@@ -124,13 +165,17 @@ class DeterministicAgent:
         if strategy in (RetryStrategy.FAIL_FAST, RetryStrategy.ESCALATE_TO_HUMAN):
             return result, 0, 0.0
 
+        # No retry budget: the outcome is already decided, skip the retry machinery
+        if config.get("max_retries", 3) <= 0:
+            return result, 0, 0.0
+
         return await self._retry_with_strategy(
             strategy, config, method, endpoint, params, json_body
         )
 
-    def _resolve_strategy(self, tool_name: str, error_code: str) -> Dict[str, Any]:
+    def _resolve_strategy(self, tool_name: str, error_code: int) -> Dict[str, Any]:
         """Lookup playbook by tool_name + error_code, fallback to default."""
-        tool_config = self.playbook_data.get(tool_name, {})
+        tool_config = self._strategy_index.get(tool_name, {})
         entry = tool_config.get(error_code)
         if entry:
             return entry
@@ -148,16 +193,20 @@ class DeterministicAgent:
 
         max_retries = config.get("max_retries", 3)
         total_delay = 0.0
+        # Bind hot-loop lookups once per retry sequence
+        send_request = self.executor.send_request
+        jitter = self.executor.calculate_jittered_backoff
+        simulate_delays = self.simulate_delays
 
         for attempt in range(1, max_retries + 1):
             delay = self._calculate_delay(strategy, config, attempt)
-            jittered = self.executor.calculate_jittered_backoff(delay)
+            jittered = jitter(delay)
             total_delay += jittered
 
-            if self.simulate_delays:
+            if simulate_delays:
                 await asyncio.sleep(jittered)
 
-            result = await self.executor.send_request(method, endpoint, params, json_body)
+            result = await send_request(method, endpoint, params, json_body)
 
             if result.get("status") == Status.SUCCESS:
                 return result, attempt, total_delay
@@ -176,6 +225,8 @@ class DeterministicAgent:
 
         if strategy == RetryStrategy.RETRY_EXPONENTIAL:
             base = config.get("base_delay", 1.0)
+            if attempt <= len(_EXP_FACTORS):
+                return base * _EXP_FACTORS[attempt - 1]
             return base * (2 ** (attempt - 1))
 
         return 1.0
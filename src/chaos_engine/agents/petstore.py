@@ -7,11 +7,10 @@ Corrige el acoplamiento y el error de sintaxis.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional, Protocol, Set, Type, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, Set, Tuple, Type, runtime_checkable
 
 from dotenv import load_dotenv
 
@@ -23,6 +22,67 @@ from google.adk.runners import InMemoryRunner
 # Core Logic
 from chaos_engine.core.config import load_config, get_model_name
 from chaos_engine.core.protocols import Executor
+from chaos_engine.core.serialization import load_file_cached
+
+
+# Static parts of the process_order system instruction, built once at import.
+# Only the order id varies per call, so the prompt text stays byte-identical.
+_INSTRUCTION_HEAD = """
+            SYSTEM ROLE: DETERMINISTIC WORKFLOW ENGINE
+            You are not a chat assistant. You are a robotic process execution engine.
+            Order ID: """
+_INSTRUCTION_TAIL = """
+
+            ====================
+            EXECUTION PROTOCOL (PRIMARY FLOW)
+            ====================
+            You MUST execute the following 4 tools in STRICT SEQUENCE.
+            You MUST use the EXACT parameters defined below. Do not guess.
+
+            1. CALL `get_inventory()`
+            - Verify stock levels.
+
+            2. CALL `find_pets_by_status(status='available')`
+            - CRITICAL: You MUST explicitly provide `status='available'`.
+            - From the result, EXTRACT the first `id` and `name`.
+
+            3. CALL `place_order(pet_id=..., quantity=1)`
+            - Use the `id` from Step 2.
+            - CRITICAL: You MUST explicitly provide `quantity=1`.
+
+            4. CALL `update_pet_status(pet_id=..., status='sold', name=...)`
+            - Use the `id` and `name` from Step 2.
+            - CRITICAL: You MUST explicitly provide `status='sold'`.
+
+            ==============================================
+             ERROR HANDLING (CONDITIONAL CHAOS RESPONSE)
+            ==============================================
+            If AND ONLY IF the last API tool call (Steps 1-4) returns an error status:
+            1. IMMEDIATELY call `lookup_playbook(tool_name, error_code)`.
+            2. OBEY the playbook strategy strictly:
+            - If "Retry": Call the failed tool again.
+            - If "Wait": Call `wait_seconds(seconds)`.
+            - If "Escalate": Call `report_workflow_failure`.
+
+            ====================
+            FINAL OUTPUT FORMAT
+            ====================
+            Upon successful completion of Step 4, you MUST output a Single Raw JSON Object.
+            DO NOT use Markdown code blocks (no ```json).
+            DO NOT add conversational text.
+            Output EXACTLY this structure:
+
+            
+            "selected_pet_id": <integer_id>,
+            "completed": true,
+            "error": null
+            
+            """
+
+# Workflow steps that must all succeed for an order to count as complete.
+_REQUIRED_STEPS = frozenset(
+    {"get_inventory", "find_pets_by_status", "place_order", "update_pet_status"}
+)
 
 
 @runtime_checkable
@@ -44,6 +104,7 @@ class PetstoreAgent:
         verbose: bool = False,
         mock_mode: bool = None,
         simulate_delays: bool = True,
+        llm: Optional[Gemini] = None,
     ):
         # 1. CARGA EXPLÍCITA DE CREDENCIALES Y CONFIG
         load_dotenv()
@@ -63,11 +124,20 @@ class PetstoreAgent:
         self.playbook_path = playbook_path
         self.playbook_data = self._load_playbook()
         self._successful_steps: Set[str] = set()
+        # (tool_name, error_code) -> lookup_playbook response; the playbook is fixed per agent.
+        self._lookup_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # Model handle; callers running many agents in one event loop may share one.
+        self._llm: Gemini | None = llm
+
+    def _get_llm(self) -> Gemini:
+        """Return this agent's model handle, creating it on first use."""
+        if self._llm is None:
+            self._llm = self.llm_client_constructor(model=self.model_name, temperature=0.0)
+        return self._llm
 
     def _load_playbook(self) -> Dict:
         try:
-            with open(self.playbook_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_file_cached(self.playbook_path)
         except Exception:
             self.logger.error("Error loading playbook %s", self.playbook_path, exc_info=True)
             return {}
@@ -117,12 +187,20 @@ class PetstoreAgent:
     async def lookup_playbook(self, tool_name: str, error_code: str) -> Dict[str, Any]:
         """Consults the Chaos Playbook."""
         if self.verbose: self.logger.info("PLAYBOOK LOOKUP: %s -> %s", tool_name, error_code)
+        key = (tool_name, str(error_code))
+        cached = self._lookup_cache.get(key)
+        if cached is not None:
+            return cached
+
         tool_config = self.playbook_data.get(tool_name, {})
-        strategy = tool_config.get(str(error_code))
+        strategy = tool_config.get(key[1])
         if strategy:
-            return {"status": "success", "found": True, "recommendation": strategy}
-        default = self.playbook_data.get("default")
-        return {"status": "success", "found": False, "recommendation": default}
+            response = {"status": "success", "found": True, "recommendation": strategy}
+        else:
+            default = self.playbook_data.get("default")
+            response = {"status": "success", "found": False, "recommendation": default}
+        self._lookup_cache[key] = response
+        return response
 
     async def report_workflow_failure(self, reason: str = "Unknown failure") -> dict:
         """Call if you cannot proceed."""
@@ -146,73 +224,23 @@ class PetstoreAgent:
         
         adk_agent = LlmAgent(
             name="PetstoreChaosAgent",
-            model=self.llm_client_constructor(model=self.model_name, temperature=0.0), 
-            instruction=f"""
-            SYSTEM ROLE: DETERMINISTIC WORKFLOW ENGINE
-            You are not a chat assistant. You are a robotic process execution engine.
-            Order ID: {order_id}
-
-            ====================
-            EXECUTION PROTOCOL (PRIMARY FLOW)
-            ====================
-            You MUST execute the following 4 tools in STRICT SEQUENCE.
-            You MUST use the EXACT parameters defined below. Do not guess.
-
-            1. CALL `get_inventory()`
-            - Verify stock levels.
-
-            2. CALL `find_pets_by_status(status='available')`
-            - CRITICAL: You MUST explicitly provide `status='available'`.
-            - From the result, EXTRACT the first `id` and `name`.
-
-            3. CALL `place_order(pet_id=..., quantity=1)`
-            - Use the `id` from Step 2.
-            - CRITICAL: You MUST explicitly provide `quantity=1`.
-
-            4. CALL `update_pet_status(pet_id=..., status='sold', name=...)`
-            - Use the `id` and `name` from Step 2.
-            - CRITICAL: You MUST explicitly provide `status='sold'`.
-
-            ==============================================
-             ERROR HANDLING (CONDITIONAL CHAOS RESPONSE)
-            ==============================================
-            If AND ONLY IF the last API tool call (Steps 1-4) returns an error status:
-            1. IMMEDIATELY call `lookup_playbook(tool_name, error_code)`.
-            2. OBEY the playbook strategy strictly:
-            - If "Retry": Call the failed tool again.
-            - If "Wait": Call `wait_seconds(seconds)`.
-            - If "Escalate": Call `report_workflow_failure`.
-
-            ====================
-            FINAL OUTPUT FORMAT
-            ====================
-            Upon successful completion of Step 4, you MUST output a Single Raw JSON Object.
-            DO NOT use Markdown code blocks (no ```json).
-            DO NOT add conversational text.
-            Output EXACTLY this structure:
-
-            
-            "selected_pet_id": <integer_id>,
-            "completed": true,
-            "error": null
-            
-            """,
+            model=self._get_llm(),
+            instruction=f"{_INSTRUCTION_HEAD}{order_id}{_INSTRUCTION_TAIL}",
             tools=self.get_tool_list()
         )
 
         runner = InMemoryRunner(agent=adk_agent, app_name="chaos_playbook")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # 🚨 FIX ESTRUCTURAL: El try-except debe envolver el bloque de ejecución, no la definición.
         try:
             # Le damos un empujón inicial claro
             await runner.run_debug(f"Inicia la secuencia obligatoria para {order_id}. Llama a la herramienta 1 (get_inventory).")
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             
             # ✅ VALIDACIÓN DE ÉXITO FINAL (Código Python, no LLM)
-            REQUIRED_STEPS = {"get_inventory", "find_pets_by_status", "place_order", "update_pet_status"}
-            is_complete = REQUIRED_STEPS.issubset(self._successful_steps)
+            is_complete = _REQUIRED_STEPS.issubset(self._successful_steps)
             
             status = "success" if is_complete else "failure"
             
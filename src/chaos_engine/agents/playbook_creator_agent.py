@@ -1,16 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List
 from google.adk.agents import LlmAgent
 from ..tools import petstore_tools
 from ..tools.playbook_tools import get_playbook, add_scenario_to_playbook
 from ..core.playbook_storage import PlaybookStorage
 
 
-class AddScenarioResponse(TypedDict):
-    message: str
-
-
 class PlaybookCreatorToolKit:
     """Encapsulates all tools for the PlaybookCreatorAgent."""
 
@@ -33,8 +29,8 @@ class PlaybookCreatorToolKit:
     async def update_pet_status(self, pet_id: int, name: str, status: str) -> dict:
         return await petstore_tools.update_pet_status(self.chaos_proxy, pet_id, name, status)
 
-    async def wait_seconds(self, seconds: int) -> str:
-        return await petstore_tools.wait_seconds(seconds)
+    async def wait_seconds(self, seconds: int) -> dict:
+        return await petstore_tools.wait_seconds(self.chaos_proxy, seconds)
 
     # =========================
     # Playbook tools
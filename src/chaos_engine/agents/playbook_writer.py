@@ -20,7 +20,7 @@ from chaos_engine.core.types import RetryStrategy, Status
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FailurePattern:
     """Aggregated failure statistics for a specific workflow step."""
     step: str
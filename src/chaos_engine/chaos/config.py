@@ -19,7 +19,6 @@ from __future__ import annotations
 import logging
 import random
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Literal, Optional
 
 logger = logging.getLogger(__name__)
@@ -48,8 +47,8 @@ class ChaosConfig:
     seed: Optional[int] = None
     verbose: bool = False 
     
-    # Private: random instance for deterministic behavior
-    _random_instance: random.Random = field(default_factory=random.Random, init=False, repr=False)
+    # Private: random instance for deterministic behavior (seeded in __post_init__)
+    _random_instance: random.Random = field(init=False, repr=False)
 
     def get_assets_dir(self) -> str:
         """Get the assets directory path."""
@@ -57,9 +56,9 @@ class ChaosConfig:
 
     def __post_init__(self):
         """Initialize random instance after dataclass creation."""
-        # Set seed if provided
-        if self.seed is not None:
-            self._random_instance.seed(self.seed)
+        # Seed once at construction (None -> OS entropy) instead of building an
+        # entropy-seeded generator and immediately re-seeding it.
+        self._random_instance = random.Random(self.seed)
 
         logger.debug("[CHAOS INIT] Creating ChaosConfig: enabled=%s, failure_rate=%s, failure_type=%s, max_delay_seconds=%s, seed=%s, verbose=%s",
                      self.enabled, self.failure_rate, self.failure_type, self.max_delay_seconds, self.seed, self.verbose)
@@ -87,9 +86,9 @@ class ChaosConfig:
         random_value = self._random_instance.random()
         inject = random_value < self.failure_rate
 
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        logger.debug("[CHAOS CHECK %s] should_inject_failure(): enabled=%s, failure_rate=%s, random_value=%.6f, inject=%s",
-                     timestamp, self.enabled, self.failure_rate, random_value, inject)
+        # No wall-clock stamp here: log records already carry their creation time.
+        logger.debug("[CHAOS CHECK] should_inject_failure(): enabled=%s, failure_rate=%s, random_value=%.6f, inject=%s",
+                     self.enabled, self.failure_rate, random_value, inject)
 
         return inject
 
@@ -3,14 +3,15 @@ Chaos Proxy - Middleware for Chaos Injection.
 """
 from __future__ import annotations
 
-import json
 import logging
 import random
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
+from chaos_engine.core.serialization import load_file, loads
 from chaos_engine.core.types import Status
 
 _FALLBACK_ERROR_CODES: Dict[str, str] = {
@@ -18,6 +19,43 @@ _FALLBACK_ERROR_CODES: Dict[str, str] = {
     "503": "Service Unavailable (Fallback)",
 }
 
+# Default knowledge base, derived from __file__ (works in source-layout installs).
+_DEFAULT_ERROR_CODES_PATH = (
+    Path(__file__).resolve().parents[3] / "assets" / "knowledge_base" / "http_error_codes.json"
+)
+
+# Injectable (code, message) pairs, parsed from a knowledge base.
+ChaosTable = Tuple[Tuple[int, str], ...]
+
+# Parsed knowledge bases shared across proxies: path -> (mtime, error codes, chaos table).
+# A fresh ChaosProxy is built per experiment, so without this every run
+# re-reads and re-parses the same JSON file and rebuilds its chaos table.
+_ERROR_CODES_CACHE: Dict[Path, Tuple[float, Dict[str, str], ChaosTable]] = {}
+
+
+# Real-mode request dispatch: GET carries query params, these carry a JSON body.
+_SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Canned mock-mode responses, built once at import time.
+_MOCK_INVENTORY: Dict[str, Any] = {
+    "status": Status.SUCCESS, "code": 200, "data": {"available": 100, "sold": 5, "pending": 2},
+}
+_MOCK_FIND_PETS: Dict[str, Any] = {
+    "status": Status.SUCCESS, "code": 200,
+    "data": [{"id": 12345, "name": "MockPet", "status": "available"}],
+}
+_MOCK_ORDER: Dict[str, Any] = {
+    "status": Status.SUCCESS, "code": 200,
+    "data": {"id": 999, "petId": 12345, "status": "placed", "complete": True},
+}
+_MOCK_UPDATE_PET: Dict[str, Any] = {
+    "status": Status.SUCCESS, "code": 200, "data": {"id": 12345, "name": "MockPet", "status": "sold"},
+}
+_MOCK_DEFAULT: Dict[str, Any] = {
+    "status": Status.SUCCESS, "code": 200, "data": {"message": "Mock success"},
+}
+
 
 class ChaosProxy:
     def __init__(
@@ -32,32 +70,56 @@ class ChaosProxy:
         self.rng = random.Random(seed)
         self.mock_mode = mock_mode
         self.verbose = verbose
+        # Per-request call logs reach the console only for verbose proxies.
+        self._call_log_level = logging.INFO if verbose else logging.DEBUG
         self.logger = logging.getLogger("ChaosProxy")
         self.base_url = "https://petstore3.swagger.io/api/v3"
-        self.error_codes = self._load_error_codes(error_codes_path)
+        self.error_codes, self._chaos_table = self._load_error_codes(error_codes_path)
         self.base_delay = 1.0
         self._client: httpx.AsyncClient | None = None
 
-    def _load_error_codes(self, explicit_path: str | Path | None) -> Dict[str, str]:
-        """Load HTTP error definitions from knowledge base."""
+    def _load_error_codes(
+        self, explicit_path: str | Path | None
+    ) -> Tuple[Dict[str, str], ChaosTable]:
+        """Load HTTP error definitions and their chaos table (cached per file mtime)."""
         try:
-            if explicit_path is not None:
-                json_path = Path(explicit_path)
-            else:
-                # Default: derive from __file__ (works in source-layout installs)
-                project_root = Path(__file__).resolve().parents[3]
-                json_path = project_root / "assets" / "knowledge_base" / "http_error_codes.json"
+            json_path = Path(explicit_path) if explicit_path is not None else _DEFAULT_ERROR_CODES_PATH
 
             if json_path.exists():
-                with open(json_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                mtime = json_path.stat().st_mtime
+                cached = _ERROR_CODES_CACHE.get(json_path)
+                if cached is not None and cached[0] == mtime:
+                    return cached[1], cached[2]
+
+                error_codes = load_file(json_path)
+                table = self._build_chaos_table(error_codes)
+                _ERROR_CODES_CACHE[json_path] = (mtime, error_codes, table)
+                return error_codes, table
 
             self.logger.warning("http_error_codes.json not found at %s. Using fallback.", json_path)
-            return dict(_FALLBACK_ERROR_CODES)
 
         except Exception:
             self.logger.warning("Error loading http_error_codes.json", exc_info=True)
-            return dict(_FALLBACK_ERROR_CODES)
+
+        error_codes = dict(_FALLBACK_ERROR_CODES)
+        return error_codes, self._build_chaos_table(error_codes)
+
+    @staticmethod
+    def _build_chaos_table(error_codes: Dict[str, str]) -> ChaosTable:
+        """Precompute (code, message) pairs so fault injection is a single choice().
+
+        Codes are parsed to int once here; entries outside the 4xx/5xx range
+        (or non-numeric keys) are skipped so they can never be injected.
+        """
+        table = []
+        for code, msg in error_codes.items():
+            try:
+                code_int = int(code)
+            except ValueError:
+                continue
+            if 400 <= code_int < 600:
+                table.append((code_int, f"Simulated Chaos: {msg}"))
+        return tuple(table) or ((500, "Simulated Chaos: Unknown Error"),)
 
     def calculate_jittered_backoff(self, seconds: float) -> float:
         """
@@ -80,47 +142,57 @@ class ChaosProxy:
 
         # 1. Chaos Check
         if self.rng.random() < self.failure_rate:
-            keys = list(self.error_codes.keys())
-            if not keys: keys = ["500"]
-            
-            error_code = self.rng.choice(keys)
-            error_msg = self.error_codes.get(error_code, "Unknown Error")
-            
-            self.logger.info("CHAOS INJECTED: Simulating %s on %s", error_code, endpoint)
-            return {"status": Status.ERROR, "code": int(error_code), "message": f"Simulated Chaos: {error_msg}"}
+            error_code, message = self.rng.choice(self._chaos_table)
+
+            self.logger.log(self._call_log_level, "CHAOS INJECTED: Simulating %s on %s", error_code, endpoint)
+            return {"status": Status.ERROR, "code": error_code, "message": message}
 
         # 2. Mock Mode
         if self.mock_mode:
-            self.logger.info("MOCK API CALL: %s %s (Skipping network)", method, endpoint)
+            self.logger.log(self._call_log_level, "MOCK API CALL: %s %s (Skipping network)", method, endpoint)
             return self._generate_mock_response(method, endpoint)
         
         # 3. Real API Call
-        self.logger.info("REAL API CALL: %s %s", method, endpoint)
+        if method not in _SUPPORTED_METHODS:
+            self.logger.error("Unsupported HTTP method: %s", method)
+            return {"status": Status.ERROR, "code": 500, "message": f"Unsupported HTTP method: {method}"}
+
+        self.logger.log(self._call_log_level, "REAL API CALL: %s %s", method, endpoint)
         url = f"{self.base_url}{endpoint}"
         client = await self._get_client()
         try:
-            if method == "GET":
-                resp = await client.get(url, params=params, timeout=10.0)
-            elif method == "POST":
-                resp = await client.post(url, json=json_body, timeout=10.0)
-            elif method == "PUT":
-                resp = await client.put(url, json=json_body, timeout=10.0)
-            elif method == "DELETE":
-                resp = await client.delete(url, timeout=10.0)
-            elif method == "PATCH":
-                resp = await client.patch(url, json=json_body, timeout=10.0)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            if resp.status_code >= 400:
-                self.logger.warning("API Error %d: %s", resp.status_code, resp.text[:100])
-                return {"status": Status.ERROR, "code": resp.status_code, "message": resp.text}
-
-            return {"status": Status.SUCCESS, "code": resp.status_code, "data": resp.json()}
-
-        except Exception as e:
+            resp = await client.request(
+                method,
+                url,
+                params=params if method == "GET" else None,
+                json=json_body if method in _BODY_METHODS else None,
+                timeout=10.0,
+            )
+        except httpx.TimeoutException:
+            self.logger.error("Timeout on %s %s", method, endpoint)
+            return {"status": Status.ERROR, "code": 408, "message": "Request timed out"}
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
             self.logger.error("Network Exception: %s", e)
             return {"status": Status.ERROR, "code": 500, "message": str(e)}
+        except ValueError as e:
+            # Request could not be built (e.g. non-JSON-compliant body); nothing was sent
+            self.logger.error("Invalid request %s %s: %s", method, endpoint, e)
+            return {"status": Status.ERROR, "code": 500, "message": f"Invalid request: {e}"}
+
+        if resp.status_code >= 400:
+            # Bounded like HttpExecutor: results keep the message, not the whole page
+            message = resp.text[:500]
+            self.logger.warning("API Error %d: %s", resp.status_code, message[:100])
+            return {"status": Status.ERROR, "code": resp.status_code, "message": message}
+
+        try:
+            data = loads(resp.content)
+        except ValueError as e:
+            # Malformed JSON body on a 2xx/3xx response
+            self.logger.error("Invalid JSON response from %s %s: %s", method, endpoint, e)
+            return {"status": Status.ERROR, "code": 500, "message": f"Invalid JSON response: {e}"}
+
+        return {"status": Status.SUCCESS, "code": resp.status_code, "data": data}
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Return reusable httpx client, creating one if needed."""
@@ -135,13 +207,20 @@ class ChaosProxy:
             self._client = None
 
     def _generate_mock_response(self, method: str, endpoint: str) -> Dict[str, Any]:
-        if "inventory" in endpoint:
-            return {"status": Status.SUCCESS, "code": 200, "data": {"available": 100, "sold": 5, "pending": 2}}
-        elif "findByStatus" in endpoint:
-            return {"status": Status.SUCCESS, "code": 200, "data": [{"id": 12345, "name": "MockPet", "status": "available"}]}
-        elif "order" in endpoint:
-            return {"status": Status.SUCCESS, "code": 200, "data": {"id": 999, "petId": 12345, "status": "placed", "complete": True}}
-        elif "pet" in endpoint and method == "PUT":
-             return {"status": Status.SUCCESS, "code": 200, "data": {"id": 12345, "name": "MockPet", "status": "sold"}}
-        else:
-            return {"status": Status.SUCCESS, "code": 200, "data": {"message": "Mock success"}}
\ No newline at end of file
+        # Outer dict is copied so callers may annotate it; payloads are shared and read-only.
+        return dict(_resolve_mock_template(method, endpoint))
+
+
+@lru_cache(maxsize=256)
+def _resolve_mock_template(method: str, endpoint: str) -> Dict[str, Any]:
+    """Route (method, endpoint) to its canned response; memoized since the workflow reuses routes."""
+    if "inventory" in endpoint:
+        return _MOCK_INVENTORY
+    elif "findByStatus" in endpoint:
+        return _MOCK_FIND_PETS
+    elif "order" in endpoint:
+        return _MOCK_ORDER
+    elif "pet" in endpoint and method == "PUT":
+        return _MOCK_UPDATE_PET
+    else:
+        return _MOCK_DEFAULT
@@ -7,6 +7,8 @@ __all__ = [
     "playbook_storage",
     "protocols",
     "resilience",
+    "runtime",
+    "serialization",
     "settings",
     "types",
 ]
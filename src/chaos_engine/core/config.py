@@ -6,13 +6,31 @@ Soporta múltiples entornos (dev/prod) con variables de entorno.
 """
 from __future__ import annotations
 
+import copy
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+# Parsed YAML files keyed by path: path -> (mtime, raw config).
+# PetstoreAgent and EvaluationRunner call load_config() on every construction,
+# so without this the same file is re-read and re-parsed per test case.
+_YAML_CACHE: Dict[Path, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _read_yaml(config_file: Path) -> Dict[str, Any]:
+    """Parse a YAML config file, reusing the previous parse while its mtime is unchanged."""
+    mtime = config_file.stat().st_mtime
+    cached = _YAML_CACHE.get(config_file)
+    if cached is None or cached[0] != mtime:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            cached = (mtime, yaml.safe_load(f))
+        _YAML_CACHE[config_file] = cached
+    # Callers get their own copy so they can't corrupt the cached parse.
+    return copy.deepcopy(cached[1])
+
 class ConfigLoader:
     """
     Carga configuración desde archivos YAML basado en el entorno.
@@ -68,8 +86,7 @@ class ConfigLoader:
                 f"   {list(self.config_dir.glob('*.yaml'))}"
             )
         
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = _read_yaml(config_file)
         
         config = self._enrich_with_env_vars(config)
         return config
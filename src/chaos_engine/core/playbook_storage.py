@@ -8,11 +8,14 @@ Supports hot-reload via file modification monitoring.
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+from chaos_engine.core.serialization import load_file
 
 logger = logging.getLogger(__name__)
 
@@ -54,23 +57,48 @@ class PlaybookStorage:
             with open(self.file_path, "w") as f:
                 json.dump({}, f, indent=2)
 
-     
-    async def _read_playbook(self) -> dict:
-        async with self._lock:
-            if not self.file_path.exists() or self.file_path.stat().st_size == 0:
+    def _read_playbook_sync(self) -> dict:
+        if not self.file_path.exists() or self.file_path.stat().st_size == 0:
             # initialize with empty matrix
-                return {}
-            try:
-                with open(self.file_path, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+            return {}
+        try:
+            return load_file(self.file_path)
+        except json.JSONDecodeError:
             # corrupted file? reset to empty matrix
-                return {}        
+            return {}
+
+    def _write_playbook_sync(self, data: Dict[str, Any]) -> None:
+        with open(self.file_path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    # Disk I/O runs in a worker thread so the event loop keeps serving other
+    # experiments while the playbook is read or rewritten.
+    async def _read_playbook(self) -> dict:
+        async with self._lock:
+            return await asyncio.to_thread(self._read_playbook_sync)
 
     async def _write_playbook(self, data: Dict[str, Any]):
         async with self._lock:
-            with open(self.file_path, "w") as f:
-                json.dump(data, f, indent=2)
+            await asyncio.to_thread(self._write_playbook_sync, data)
+            # We just wrote the file, so refresh the cache directly instead of
+            # relying on an mtime tick (coarse on some filesystems).
+            self._cache = copy.deepcopy(data)
+            self._last_mtime = os.path.getmtime(self.file_path)
+
+    def _update_playbook_sync(self, mutator: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        playbook = self._read_playbook_sync()
+        mutator(playbook)
+        self._write_playbook_sync(playbook)
+        return playbook
+
+    async def _update(self, mutator: Callable[[Dict[str, Any]], None]) -> None:
+        # Read, mutate and write in one locked worker call: releasing the lock
+        # between the read and the write would let concurrent updates clobber
+        # each other.
+        async with self._lock:
+            playbook = await asyncio.to_thread(self._update_playbook_sync, mutator)
+            self._cache = copy.deepcopy(playbook)
+            self._last_mtime = os.path.getmtime(self.file_path)
 
     # ---------------------------------------------------------
     # Public API
@@ -84,6 +112,10 @@ class PlaybookStorage:
         """Replace entire playbook."""
         await self._write_playbook(playbook)
 
+    async def update_playbook(self, mutator: Callable[[Dict[str, Any]], None]) -> None:
+        """Apply ``mutator`` to the playbook in place as one atomic read-modify-write."""
+        await self._update(mutator)
+
     async def add_or_update_strategy(
         self,
         api: str,
@@ -97,18 +129,17 @@ class PlaybookStorage:
         if config is None:
             config = {}
 
-        playbook = await self._read_playbook()
-
-        if api not in playbook:
-            playbook[api] = {}
+        def _apply(playbook: Dict[str, Any]) -> None:
+            if api not in playbook:
+                playbook[api] = {}
 
-        playbook[api][str(status_code)] = {
-            "strategy": strategy,
-            "reasoning": reasoning,
-            "config": config
-        }
+            playbook[api][str(status_code)] = {
+                "strategy": strategy,
+                "reasoning": reasoning,
+                "config": config
+            }
 
-        await self._write_playbook(playbook)
+        await self._update(_apply)
 
     async def remove_strategy(
         self,
@@ -117,12 +148,11 @@ class PlaybookStorage:
     ) -> None:
         """Remove a strategy rule."""
 
-        playbook = await self._read_playbook()
-
-        if api in playbook and str(status_code) in playbook[api]:
-            del playbook[api][str(status_code)]
+        def _apply(playbook: Dict[str, Any]) -> None:
+            if api in playbook and str(status_code) in playbook[api]:
+                del playbook[api][str(status_code)]
 
-        await self._write_playbook(playbook)
+        await self._update(_apply)
 
     async def set_default_strategy(
         self,
@@ -135,15 +165,14 @@ class PlaybookStorage:
         if config is None:
             config = {}
 
-        playbook = await self._read_playbook()
-
-        playbook["default"] = {
-            "strategy": strategy,
-            "reasoning": reasoning,
-            "config": config
-        }
+        def _apply(playbook: Dict[str, Any]) -> None:
+            playbook["default"] = {
+                "strategy": strategy,
+                "reasoning": reasoning,
+                "config": config
+            }
 
-        await self._write_playbook(playbook)
+        await self._update(_apply)
 
     async def resolve_strategy(
         self,
@@ -153,13 +182,17 @@ class PlaybookStorage:
         """
         Resolve strategy for given api + status_code.
         Falls back to default if not found.
+
+        Served from the hot-reload cache, so repeated lookups cost a stat()
+        rather than a full read + parse. The returned entry is shared with
+        the cache and must not be mutated.
         """
 
-        playbook = await self._read_playbook()
+        playbook = await self.get_cached_playbook()
 
-        api_rules = playbook.get(api, {})
-        if str(status_code) in api_rules:
-            return api_rules[str(status_code)]
+        entry = playbook.get(api, {}).get(str(status_code))
+        if entry is not None:
+            return entry
 
         return playbook.get("default")
 
@@ -176,10 +209,16 @@ class PlaybookStorage:
             return False
 
     async def _reload_if_changed(self) -> None:
-        """Reload the playbook from disk if the file has been modified."""
-        if self._file_changed():
+        """Reload the playbook from disk if it was never loaded or has been modified."""
+        if self._cache is None or self._file_changed():
+            # Take the mtime before reading so a concurrent write is seen next time.
+            try:
+                mtime = os.path.getmtime(self.file_path)
+            except OSError:
+                # Missing file: serve an empty playbook until it reappears.
+                mtime = 0.0
             self._cache = await self._read_playbook()
-            self._last_mtime = os.path.getmtime(self.file_path)
+            self._last_mtime = mtime
             logger.info("Playbook hot-reloaded from %s", self.file_path)
 
     async def get_cached_playbook(self) -> Dict[str, Any]:
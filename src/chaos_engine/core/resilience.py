@@ -20,6 +20,8 @@ class CircuitBreakerProxy:
 
     def __init__(self, wrapped_executor: Executor, failure_threshold: int = 5, cooldown_seconds: int = 60):
         self._executor = wrapped_executor
+        # Resolved once: the wrapped executor's jitter hook, if it has one.
+        self._jitter = getattr(wrapped_executor, "calculate_jittered_backoff", None)
         self._failure_threshold = failure_threshold
         self._cooldown_seconds = cooldown_seconds
 
@@ -28,12 +30,14 @@ class CircuitBreakerProxy:
         self._is_open = False
         self._half_open = False
         self._opened_timestamp = 0.0
+        # Open period (by its timestamp) whose first blocked request was already warned about.
+        self._warned_open_at: float | None = None
         self.logger = logging.getLogger("CircuitBreaker")
 
     def calculate_jittered_backoff(self, seconds: float) -> float:
         """Delegates the jitter calculation to the wrapped executor (e.g., ChaosProxy)."""
-        if hasattr(self._executor, "calculate_jittered_backoff"):
-            return self._executor.calculate_jittered_backoff(seconds)
+        if self._jitter is not None:
+            return self._jitter(seconds)
         # Fallback if the wrapped executor does not have the method.
         return seconds
 
@@ -42,7 +46,13 @@ class CircuitBreakerProxy:
         # 1. OPEN STATE (Protection)
         if self._is_open:
             if time.time() < self._opened_timestamp + self._cooldown_seconds:
-                self.logger.warning("CIRCUIT OPEN: Request to %s blocked (Cooldown active).", endpoint)
+                # Warn once per open period; the rest of the rejections go to DEBUG.
+                if self._warned_open_at != self._opened_timestamp:
+                    self._warned_open_at = self._opened_timestamp
+                    level = logging.WARNING
+                else:
+                    level = logging.DEBUG
+                self.logger.log(level, "CIRCUIT OPEN: Request to %s blocked (Cooldown active).", endpoint)
                 return {"status": Status.ERROR, "code": 503, "message": "Circuit Breaker Open: Service is down."}
             else:
                 # Transition to Half-Open: allow exactly one probe request.
@@ -0,0 +1,34 @@
+"""
+Event-loop runtime helpers for CLI entry points.
+
+uvloop is optional: when installed, coroutines are driven by its libuv-based
+loop, which lowers per-await and per-task overhead for the many small awaits
+of concurrent experiments. Otherwise the stock asyncio loop is used.
+
+On Python 3.12+ the loop also gets ``asyncio.eager_task_factory``: tasks
+created by ``gather`` start running immediately and, when they finish
+without suspending (mock-mode experiments, cache hits), never pay for a
+scheduling round-trip.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Drop-in replacement for ``asyncio.run`` that prefers uvloop when available."""
+    loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        eager_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_factory is not None:
+            runner.get_loop().set_task_factory(eager_factory)
+        return runner.run(coro)
@@ -0,0 +1,68 @@
+"""
+JSON decoding helpers with optional orjson acceleration.
+
+orjson is not a hard dependency: when it is installed, payloads are parsed
+by its native decoder, otherwise the stdlib ``json`` module is used.
+
+The two backends do not accept the same inputs: orjson rejects ``NaN`` /
+``Infinity`` literals and integers wider than 64 bits, both of which
+``json`` parses. Documents orjson refuses are therefore re-parsed with
+``json``, so results (and ``json.JSONDecodeError`` on malformed input) are
+the same whichever backend is active; only the fast path differs.
+"""
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Final, Tuple, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Parsed documents keyed by resolved path: path -> ((mtime_ns, size), document).
+# Bounded LRU, since the evolver writes a new playbook file per variant.
+_FILE_CACHE: OrderedDict[Path, Tuple[Tuple[int, int], Any]] = OrderedDict()
+_FILE_CACHE_SIZE: Final[int] = 32
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or text."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """Read and parse a UTF-8 JSON file in one go."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def load_file_cached(path: Union[str, Path]) -> Any:
+    """
+    Like load_file, but reuse the parsed document while the file's mtime and
+    size are unchanged. The returned object is shared between callers and
+    must be treated as read-only.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    # Size too: a rewrite within one coarse mtime tick still changes it.
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _FILE_CACHE.get(resolved)
+    if cached is not None and cached[0] == version:
+        _FILE_CACHE.move_to_end(resolved)
+        return cached[1]
+
+    document = load_file(resolved)
+    _FILE_CACHE[resolved] = (version, document)
+    _FILE_CACHE.move_to_end(resolved)
+    if len(_FILE_CACHE) > _FILE_CACHE_SIZE:
+        _FILE_CACHE.popitem(last=False)
+    return document
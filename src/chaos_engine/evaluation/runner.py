@@ -4,11 +4,12 @@ Updated with Observability (Logging) and Phase 6 Dependency Injection.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import time
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 # Imports for Dependency Injection
 from chaos_engine.agents.petstore import PetstoreAgent
@@ -17,7 +18,7 @@ from chaos_engine.core.resilience import CircuitBreakerProxy
 from chaos_engine.core.config import load_config, get_model_name
 from google.adk.models.google_llm import Gemini
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     case_id: str
     passed: bool
@@ -29,9 +30,13 @@ class TestResult:
         return asdict(self)
 
 class EvaluationRunner:
-    def __init__(self, agent_playbook: str):
+    def __init__(self, agent_playbook: str, max_concurrency: int = 1):
         self.logger = logging.getLogger("evaluator")
         self.playbook_path = agent_playbook
+        # Cases are independent (fresh proxy + agent each), so their LLM round-trips
+        # can overlap. Sequential by default: overlapping cases risk 429 quota
+        # errors and inflate the per-case latencies the suite asserts on.
+        self.max_concurrency = max(1, max_concurrency)
         
         # 1. Load General Configuration
         self.config = load_config()
@@ -67,25 +72,37 @@ class EvaluationRunner:
         self.logger.info("STARTING SUITE: %s", suite["name"])
         self.logger.info("MODE: %s", "MOCK (Offline)" if self.mock_mode else "REAL API")
         
-        results = []
-        for case in suite['test_cases']:
-            self.logger.info("Running Case: %s (%s)", case["id"], case["description"])
-            result = await self._run_single_case(case)
-            results.append(result)
-            
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # One model handle per suite run: its API client stays bound to this
+        # event loop and keeps connections warm across cases.
+        llm = Gemini(model=self.model_name, temperature=0.0)
+
+        async def _bounded(case: Dict) -> TestResult:
+            async with semaphore:
+                self.logger.info("Running Case: %s (%s)", case["id"], case["description"])
+                result = await self._run_single_case(case, llm)
+
             icon = "✅" if result.passed else "❌"
-            self.logger.info("   Result: %s %s (%.2fs)", icon, result.reason, result.duration)
-            
-        return results
+            self.logger.info("   Result [%s]: %s %s (%.2fs)", case["id"], icon, result.reason, result.duration)
+            return result
+
+        # Tasks are collected in suite order. Cases report their own crashes as
+        # failed results, so only a runner bug cancels the rest of the group.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_bounded(case)) for case in suite['test_cases']]
+        return [task.result() for task in tasks]
 
-    async def _run_single_case(self, case: Dict) -> TestResult:
-        start_time = time.time()
+    async def _run_single_case(self, case: Dict, llm: Optional[Gemini] = None) -> TestResult:
+        start_time = time.perf_counter()
+        case_id = case['id']
         chaos_config = case['chaos_config']
+        rate = chaos_config['rate']
+        seed = chaos_config['seed']
         
         # Create fresh infrastructure per test case (no state leakage).
         test_proxy = ChaosProxy(
-            failure_rate=chaos_config['rate'],
-            seed=chaos_config['seed'],
+            failure_rate=rate,
+            seed=seed,
             verbose=True,
             mock_mode=self.mock_mode
         )
@@ -98,40 +115,45 @@ class EvaluationRunner:
             llm_client_constructor=Gemini,
             model_name=self.model_name,
             verbose=True,
+            llm=llm,
         )
 
         try:
             output = await case_agent.process_order(
                 order_id=case['input'],
-                failure_rate=chaos_config['rate'],
-                seed=chaos_config['seed']
+                failure_rate=rate,
+                seed=seed
             )
         except Exception as e:
             return TestResult(
-                case['id'], 
+                case_id, 
                 False, 
                 f"Crash during execution: {str(e)}", 
-                time.time() - start_time, 
+                time.perf_counter() - start_time, 
                 {"error": str(e)}
             )
+        finally:
+            # Release the per-case HTTP pool (real mode) as soon as the case ends
+            await test_proxy.close()
         
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         expected = case['expected']
+        status = output['status']
         
         # --- Assertion Logic ---
-        if output['status'] != expected['status']:
-            return TestResult(case['id'], False, f"Status mismatch: Got {output['status']}, expected {expected['status']}", duration, output)
+        if status != expected['status']:
+            return TestResult(case_id, False, f"Status mismatch: Got {status}, expected {expected['status']}", duration, output)
             
         if 'max_latency_ms' in expected and output['duration_ms'] > expected['max_latency_ms']:
-             return TestResult(case['id'], False, f"Latency violation: {output['duration_ms']:.0f}ms > {expected['max_latency_ms']}ms", duration, output)
+             return TestResult(case_id, False, f"Latency violation: {output['duration_ms']:.0f}ms > {expected['max_latency_ms']}ms", duration, output)
 
         steps_set = set(output.get('steps_completed', []))
         if 'must_call' in expected:
             missing = [tool for tool in expected['must_call'] if tool not in steps_set and tool != "lookup_playbook"]
             if missing:
-                return TestResult(case['id'], False, f"Missing required steps: {missing}", duration, output)
+                return TestResult(case_id, False, f"Missing required steps: {missing}", duration, output)
         
-        if 'forbidden_outcome' in expected and output['status'] == expected['forbidden_outcome']:
-             return TestResult(case['id'], False, f"Forbidden outcome occurred: {output['status']}", duration, output)
+        if 'forbidden_outcome' in expected and status == expected['forbidden_outcome']:
+             return TestResult(case_id, False, f"Forbidden outcome occurred: {status}", duration, output)
 
-        return TestResult(case['id'], True, "Passed all assertions", duration, output)
\ No newline at end of file
+        return TestResult(case_id, True, "Passed all assertions", duration, output)
\ No newline at end of file
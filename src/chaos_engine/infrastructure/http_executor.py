@@ -11,6 +11,7 @@ from typing import Any, Dict, Optional
 
 import httpx
 
+from chaos_engine.core.serialization import loads
 from chaos_engine.core.types import Status
 
 logger = logging.getLogger(__name__)
@@ -93,7 +94,7 @@ class HttpExecutor:
             return {
                 "status": Status.SUCCESS,
                 "code": response.status_code,
-                "data": response.json(),
+                "data": loads(response.content),
             }
 
         except httpx.TimeoutException:
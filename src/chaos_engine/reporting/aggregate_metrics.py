@@ -28,10 +28,13 @@ from __future__ import annotations
 
 import json
 import math
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
-@dataclass
+import numpy as np
+
+@dataclass(slots=True)
 class ExperimentResult:
     """
     Estructura de datos para representar el resultado de un experimento.
@@ -43,7 +46,7 @@ class ExperimentResult:
     playbook_strategies_used: List[str] = field(default_factory=list)
 
 # -------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class MetricsSummary:
     """Summary statistics for a set of experiments."""
     mean: float
@@ -95,10 +98,11 @@ class MetricsAggregator:
                 "inconsistent": 0
             }
 
-        # Count outcomes
-        successes = sum(1 for r in results if r.outcome == "success")
-        failures = sum(1 for r in results if r.outcome == "failure")
-        inconsistent = sum(1 for r in results if r.outcome == "inconsistent")
+        # Count outcomes (single pass)
+        outcomes = Counter(r.outcome for r in results)
+        successes = outcomes["success"]
+        failures = outcomes["failure"]
+        inconsistent = outcomes["inconsistent"]
 
         n = len(results)
         success_rate = successes / n if n > 0 else 0.0
@@ -160,25 +164,25 @@ class MetricsAggregator:
             }
 
         n = len(results)
-        inconsistent_count = sum(1 for r in results if r.outcome == "inconsistent")
+        # Single pass: outcome count and inconsistency types (for debugging)
+        inconsistent_count = 0
+        inconsistency_types: Counter = Counter()
+        for result in results:
+            if result.outcome == "inconsistent":
+                inconsistent_count += 1
+            inconsistency_types.update(result.inconsistencies)
         consistent_count = n - inconsistent_count
 
         inconsistency_rate = inconsistent_count / n if n > 0 else 0.0
         consistency_rate = 1.0 - inconsistency_rate  # NEW: Positive metric
 
-        # Count inconsistency types (for debugging)
-        inconsistency_types = {}
-        for result in results:
-            for inc_type in result.inconsistencies:
-                inconsistency_types[inc_type] = inconsistency_types.get(inc_type, 0) + 1
-
         return {
             "consistency_rate": round(consistency_rate, 4),  # NEW: Primary metric
             "inconsistency_rate": round(inconsistency_rate, 4),  # Keep for backward compat
             "consistent_count": consistent_count,
             "inconsistent_count": inconsistent_count,
             "sample_size": n,
-            "inconsistency_types": inconsistency_types
+            "inconsistency_types": dict(inconsistency_types)
         }
 
     def calculate_latency_stats(
@@ -213,32 +217,31 @@ class MetricsAggregator:
                 "std_latency_s": 0.0
             }
 
-        durations = [r.total_duration_s for r in results]
-        durations_sorted = sorted(durations)
+        durations = np.fromiter(
+            (r.total_duration_s for r in results), dtype=float, count=len(results)
+        )
+        durations.sort()
         n = len(durations)
 
         # Mean
-        mean_latency = sum(durations) / n
+        mean_latency = float(durations.mean())
 
         # Median
         if n % 2 == 0:
-            median_latency = (durations_sorted[n//2 - 1] + durations_sorted[n//2]) / 2
+            median_latency = float(durations[n//2 - 1] + durations[n//2]) / 2
         else:
-            median_latency = durations_sorted[n//2]
+            median_latency = float(durations[n//2])
 
-        # Percentiles
-        p95_index = int(n * 0.95)
-        p99_index = int(n * 0.99)
-        p95_latency = durations_sorted[p95_index] if p95_index < n else durations_sorted[-1]
-        p99_latency = durations_sorted[p99_index] if p99_index < n else durations_sorted[-1]
+        # Percentiles (nearest-rank on the sorted array, clamped to the last element)
+        p95_latency = float(durations[min(int(n * 0.95), n - 1)])
+        p99_latency = float(durations[min(int(n * 0.99), n - 1)])
 
         # Min/Max
-        min_latency = durations_sorted[0]
-        max_latency = durations_sorted[-1]
+        min_latency = float(durations[0])
+        max_latency = float(durations[-1])
 
-        # Standard deviation
-        variance = sum((d - mean_latency) ** 2 for d in durations) / n
-        std_latency = math.sqrt(variance)
+        # Standard deviation (population)
+        std_latency = float(durations.std())
 
         return {
             "mean_latency_s": round(mean_latency, 2),
@@ -7,16 +7,17 @@ Provides:
 """
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from chaos_engine.core.serialization import load_file
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentScore:
     """Scored result for a single agent across all failure rates."""
     name: str
@@ -85,7 +86,11 @@ def build_leaderboard(metrics: dict[str, Any]) -> list[AgentScore]:
 
     Returns a sorted list (best first).
     """
-    data = extract_n_agent_data(metrics)
+    return _rank_agents(extract_n_agent_data(metrics))
+
+
+def _rank_agents(data: dict[str, Any]) -> list[AgentScore]:
+    """Build the sorted leaderboard from already-extracted N-agent data."""
     scores: list[AgentScore] = []
 
     for name, agent_data in data["agents"].items():
@@ -103,7 +108,7 @@ def build_leaderboard(metrics: dict[str, Any]) -> list[AgentScore]:
     return sorted(scores, key=lambda s: s.composite_score, reverse=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunSummary:
     """Summary of a single experiment run for trend comparison."""
     run_id: str
@@ -131,11 +136,11 @@ def compare_runs(run_dirs: list[str | Path]) -> list[RunSummary]:
             logger.warning("Skipping %s: no aggregated_metrics.json", run_dir)
             continue
 
-        with open(metrics_path, "r", encoding="utf-8") as f:
-            metrics = json.load(f)
+        metrics = load_file(metrics_path)
 
+        # Single pass over the metrics feeds both the rates and the leaderboard.
         data = extract_n_agent_data(metrics)
-        leaderboard = build_leaderboard(metrics)
+        leaderboard = _rank_agents(data)
 
         # Extract timestamp from dir name (e.g., run_20260314_153000)
         timestamp = run_dir.name.replace("run_", "")
@@ -14,6 +14,7 @@ Usage::
 """
 from __future__ import annotations
 
+import asyncio
 import copy
 import json
 import logging
@@ -22,6 +23,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from chaos_engine.core.serialization import load_file
 from chaos_engine.core.types import RetryStrategy
 
 logger = logging.getLogger(__name__)
@@ -34,15 +36,22 @@ _PARAM_RANGES: dict[str, tuple[float, float]] = {
     "max_retries": (1, 8),
 }
 
-# Strategies that can be substituted for each other
-_RETRY_STRATEGIES = [
+# Strategies that can be substituted for each other (tuple for rng.choice,
+# frozenset for the per-entry membership test; both built once at import)
+_RETRY_STRATEGIES: tuple[RetryStrategy, ...] = (
     RetryStrategy.RETRY_LINEAR,
     RetryStrategy.RETRY_EXPONENTIAL,
     RetryStrategy.WAIT_AND_RETRY,
-]
+)
+_RETRY_STRATEGY_SET: frozenset[str] = frozenset(_RETRY_STRATEGIES)
 
 
-@dataclass
+def _write_json(path: Path, data: Any) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+@dataclass(slots=True)
 class MutationResult:
     """Result of evaluating a playbook variant."""
     variant_id: str
@@ -71,8 +80,7 @@ class PlaybookEvolver:
     mutation_rate: float = 0.3
 
     def _load_base(self) -> dict[str, Any]:
-        with open(self.base_playbook_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_file(self.base_playbook_path)
 
     def mutate(self, playbook: dict[str, Any], rng: random.Random) -> dict[str, Any]:
         """Create a mutated copy of the playbook.
@@ -95,7 +103,7 @@ class PlaybookEvolver:
                 config = entry.get("config", {})
 
                 # Mutation 1: swap strategy
-                if strategy in _RETRY_STRATEGIES and rng.random() < 0.2:
+                if strategy in _RETRY_STRATEGY_SET and rng.random() < 0.2:
                     new_strategy = rng.choice(_RETRY_STRATEGIES)
                     entry["strategy"] = new_strategy
                     # Ensure config keys match new strategy
@@ -126,10 +134,9 @@ class PlaybookEvolver:
         """Run parametric experiments with a playbook variant and score it."""
         from chaos_engine.simulation.parametric import AgentConfig, ParametricABTestRunner
 
-        # Write variant to temp file
+        # Write variant to temp file (off the loop: variants run concurrently)
         variant_path = work_dir / f"{variant_id}.json"
-        with open(variant_path, "w", encoding="utf-8") as f:
-            json.dump(playbook, f, indent=2)
+        await asyncio.to_thread(_write_json, variant_path, playbook)
 
         output_dir = work_dir / variant_id
         runner = ParametricABTestRunner(
@@ -144,9 +151,7 @@ class PlaybookEvolver:
         await runner.run_parametric_experiments()
 
         # Read metrics
-        metrics_path = output_dir / "aggregated_metrics.json"
-        with open(metrics_path, "r", encoding="utf-8") as f:
-            metrics = json.load(f)
+        metrics = await asyncio.to_thread(load_file, output_dir / "aggregated_metrics.json")
 
         # Aggregate across rates
         total_success = 0.0
@@ -197,15 +202,20 @@ class PlaybookEvolver:
         for gen in range(1, generations + 1):
             logger.info("Generation %d/%d: creating %d variants...", gen, generations, variants_per_gen)
 
-            results: list[MutationResult] = []
-            for v in range(variants_per_gen):
-                variant_id = f"gen{gen}_v{v}"
-                mutant = self.mutate(current_best_playbook, rng)
-                result = await self.evaluate_variant(mutant, variant_id, work_dir)
-                results.append(result)
+            # Mutate in order so the rng stream matches sequential runs, then
+            # evaluate variants concurrently (each has its own runner and output dir)
+            variants = [
+                (f"gen{gen}_v{v}", self.mutate(current_best_playbook, rng))
+                for v in range(variants_per_gen)
+            ]
+            results: list[MutationResult] = list(await asyncio.gather(*(
+                self.evaluate_variant(mutant, variant_id, work_dir)
+                for variant_id, mutant in variants
+            )))
+            for result in results:
                 logger.info(
                     "  %s: score=%.2f success=%.1f%% incons=%.3f",
-                    variant_id, result.score, result.success_rate * 100, result.avg_inconsistencies,
+                    result.variant_id, result.score, result.success_rate * 100, result.avg_inconsistencies,
                 )
 
             # Select best from this generation (include previous best)
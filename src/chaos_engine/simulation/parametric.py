@@ -6,6 +6,7 @@ EXTENDED: Support for N agent types via AgentConfig.
 """
 from __future__ import annotations
 
+import asyncio
 import csv
 import json
 import logging
@@ -26,13 +27,27 @@ _DEFAULT_CB = CircuitBreakerSettings()
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for a single agent type in parametric experiments."""
     name: str          # e.g. "baseline", "aggressive", "conservative"
     playbook_path: str  # path to playbook JSON
 
 
+@dataclass(slots=True)
+class _Bucket:
+    """Running stats for one (failure_rate, agent_type) pair."""
+
+    n: int = 0
+    successes: int = 0
+    # Welford accumulators for duration
+    dur_mean: float = 0.0
+    dur_m2: float = 0.0
+    # Welford accumulators for inconsistencies
+    inc_mean: float = 0.0
+    inc_m2: float = 0.0
+
+
 class _StreamingAggregator:
     """Online aggregator using Welford's algorithm for mean and variance.
 
@@ -42,47 +57,39 @@ class _StreamingAggregator:
 
     def __init__(self, agent_names: List[str]) -> None:
         # key: (failure_rate, agent_type) -> stats accumulator
-        self._buckets: Dict[tuple[float, str], Dict[str, Any]] = {}
+        self._buckets: Dict[tuple[float, str], _Bucket] = {}
         self._agent_names = agent_names
 
-    def _ensure_bucket(self, key: tuple[float, str]) -> Dict[str, Any]:
-        if key not in self._buckets:
-            self._buckets[key] = {
-                "n": 0,
-                "successes": 0,
-                # Welford accumulators for duration
-                "dur_mean": 0.0,
-                "dur_m2": 0.0,
-                # Welford accumulators for inconsistencies
-                "inc_mean": 0.0,
-                "inc_m2": 0.0,
-            }
-        return self._buckets[key]
+    def _ensure_bucket(self, key: tuple[float, str]) -> _Bucket:
+        b = self._buckets.get(key)
+        if b is None:
+            b = self._buckets[key] = _Bucket()
+        return b
 
     def process(self, result: Dict[str, Any]) -> None:
         """Ingest a single experiment result (O(1) memory)."""
         key = (result["failure_rate"], result["agent_type"])
         b = self._ensure_bucket(key)
 
-        b["n"] += 1
-        n = b["n"]
+        b.n += 1
+        n = b.n
 
         if result["status"] == Status.SUCCESS:
-            b["successes"] += 1
+            b.successes += 1
 
         # Welford online update — duration_ms
         dur = result["duration_ms"]
-        delta = dur - b["dur_mean"]
-        b["dur_mean"] += delta / n
-        delta2 = dur - b["dur_mean"]
-        b["dur_m2"] += delta * delta2
+        delta = dur - b.dur_mean
+        b.dur_mean += delta / n
+        delta2 = dur - b.dur_mean
+        b.dur_m2 += delta * delta2
 
         # Welford online update — inconsistencies
         inc = result.get("inconsistencies_count", 0)
-        delta_i = inc - b["inc_mean"]
-        b["inc_mean"] += delta_i / n
-        delta_i2 = inc - b["inc_mean"]
-        b["inc_m2"] += delta_i * delta_i2
+        delta_i = inc - b.inc_mean
+        b.inc_mean += delta_i / n
+        delta_i2 = inc - b.inc_mean
+        b.inc_m2 += delta_i * delta_i2
 
     def build_metrics(self) -> Dict[str, Any]:
         """Produce the aggregated_metrics.json-compatible dict."""
@@ -91,21 +98,21 @@ class _StreamingAggregator:
         # Group by failure_rate
         rates: Dict[float, Dict[str, Dict]] = defaultdict(dict)
         for (rate, agent_type), b in self._buckets.items():
-            n = b["n"]
-            std_dur = math.sqrt(b["dur_m2"] / n) if n > 1 else 0.0
-            std_inc = math.sqrt(b["inc_m2"] / n) if n > 1 else 0.0
-            success_rate = b["successes"] / n if n else 0.0
+            n = b.n
+            std_dur = math.sqrt(b.dur_m2 / n) if n > 1 else 0.0
+            std_inc = math.sqrt(b.inc_m2 / n) if n > 1 else 0.0
+            success_rate = b.successes / n if n else 0.0
             std_sr = math.sqrt(success_rate * (1 - success_rate) / n) if n else 0.0
 
             rates[rate][agent_type] = {
                 "n_runs": n,
                 "success_rate": {"mean": success_rate, "std": round(std_sr, 6)},
                 "duration_s": {
-                    "mean": (b["dur_mean"] / 1000) if n else 0,
+                    "mean": (b.dur_mean / 1000) if n else 0,
                     "std": round(std_dur / 1000, 6),
                 },
                 "inconsistencies": {
-                    "mean": b["inc_mean"],
+                    "mean": b.inc_mean,
                     "std": round(std_inc, 6),
                 },
             }
@@ -138,12 +145,16 @@ class ParametricABTestRunner:
         playbook_training_path: str = "assets/playbooks/training.json",
         simulate_delays: bool = False,
         agents: Optional[List[AgentConfig]] = None,
+        max_concurrency: int = 8,
     ):
         self.failure_rates = failure_rates
         self.experiments_per_rate = experiments_per_rate
         self.output_dir = output_dir
         self.base_seed = seed
         self.simulate_delays = simulate_delays
+        # Experiments run on independent infrastructure, so up to this many
+        # overlap their awaits (backoff sleeps dominate with simulate_delays).
+        self.max_concurrency = max(1, max_concurrency)
         self.logger = logger or logging.getLogger(__name__)
 
         # Build agent list: use explicit agents if provided, otherwise
@@ -266,20 +277,25 @@ class ParametricABTestRunner:
                 prefix = agent_name.upper()[:4]
 
                 self.logger.info("  Running %d %s experiments...", self.experiments_per_rate, agent_name)
-                for j in range(self.experiments_per_rate):
-                    seed = self.base_seed + (i * 1000) + j
-
-                    result = await self._run_single_experiment(agent_cfg, rate, seed)
-
-                    # Enrich identity
-                    result["experiment_id"] = f"{prefix}-{rate}-{j}"
-                    result["failure_rate"] = rate
-                    result["seed"] = seed
-
-                    if j % 5 == 0:
-                        self.logger.debug("    %s run %d completed", agent_name, j)
-
-                    yield result
+                # Run in windows of max_concurrency; gather keeps results in
+                # seed order so CSV rows and aggregates match a sequential run.
+                for start in range(0, self.experiments_per_rate, self.max_concurrency):
+                    window = range(start, min(start + self.max_concurrency, self.experiments_per_rate))
+                    seeds = [self.base_seed + (i * 1000) + j for j in window]
+                    results = await asyncio.gather(
+                        *(self._run_single_experiment(agent_cfg, rate, seed) for seed in seeds)
+                    )
+
+                    for j, seed, result in zip(window, seeds, results):
+                        # Enrich identity
+                        result["experiment_id"] = f"{prefix}-{rate}-{j}"
+                        result["failure_rate"] = rate
+                        result["seed"] = seed
+
+                        if j % 5 == 0:
+                            self.logger.debug("    %s run %d completed", agent_name, j)
+
+                        yield result
 
             self.logger.info("   Completed batch for rate %s", rate)
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 async def get_inventory(chaos_proxy) -> dict:
     """Returns a map of status codes to quantities from the store."""
@@ -51,8 +54,7 @@ async def wait_seconds(chaos_proxy,seconds: float) -> dict:
     Use this when a playbook strategy recommends waiting or backing off
     before retrying an operation.
     """
-    import logging
     jittered_seconds=chaos_proxy.calculate_jittered_backoff(seconds)
-    logging.getLogger(__name__).info("AGENT WAITING: %.2fs (Executing Backoff Strategy)", jittered_seconds)
+    logger.info("AGENT WAITING: %.2fs (Executing Backoff Strategy)", jittered_seconds)
     await asyncio.sleep(jittered_seconds)
     return {"status": "success", "message": f"Waited {seconds} seconds"}
\ No newline at end of file
@@ -61,18 +61,16 @@ async def add_scenario_to_playbook(
     Returns:
         AddScenarioResponse with confirmation message
     """
-    # Load existing playbook
-    playbook = await storage.load_playbook()
+    def _apply(playbook: Dict) -> None:
+        # Ensure API entry exists
+        if api not in playbook:
+            playbook[api] = {}
 
-    # Ensure API entry exists
-    if api not in playbook:
-        playbook[api] = {}
+        # Save scenario under the status code as string
+        playbook[api][str(status_code)] = strategy_payload
 
-    # Save scenario under the status code as string
-    playbook[api][str(status_code)] = strategy_payload
-
-    # Save via storage (respects asyncio.Lock)
-    await storage.save_playbook(playbook)
+    # Read-modify-write under the storage lock, so concurrent tool calls don't lose updates
+    await storage.update_playbook(_apply)
 
     return {"message": f"Scenario added for {api} [{status_code}]"}
 
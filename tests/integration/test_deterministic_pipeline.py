@@ -124,6 +124,31 @@ async def test_parametric_runner_produces_output_files(tmp_path):
     assert "playbook" in metrics["0.0"]
 
 
+@pytest.mark.asyncio
+async def test_parametric_runner_concurrency_matches_sequential(tmp_path):
+    """Overlapping experiments must not change outcomes or row order."""
+    rows_by_mode = {}
+    for concurrency in (1, 4):
+        out = tmp_path / f"c{concurrency}"
+        runner = ParametricABTestRunner(
+            failure_rates=[0.3, 0.6],
+            experiments_per_rate=7,
+            output_dir=out,
+            seed=42,
+            playbook_baseline_path=BASELINE_PLAYBOOK,
+            playbook_training_path=TRAINING_PLAYBOOK,
+            simulate_delays=False,
+            max_concurrency=concurrency,
+        )
+        await runner.run_parametric_experiments()
+        with open(out / "raw_results.csv", "r", encoding="utf-8") as f:
+            rows_by_mode[concurrency] = [
+                {k: v for k, v in row.items() if k != "duration_ms"} for row in csv.DictReader(f)
+            ]
+
+    assert rows_by_mode[1] == rows_by_mode[4]
+
+
 @pytest.mark.asyncio
 async def test_parametric_runner_zero_chaos_all_succeed(tmp_path):
     """With failure_rate=0.0, all experiments should succeed."""
@@ -1,3 +1,7 @@
+import json
+import logging
+import os
+import httpx
 import pytest
 from unittest.mock import patch, MagicMock
 from chaos_engine.chaos.proxy import ChaosProxy
@@ -41,4 +45,103 @@ async def test_chaos_proxy_injection():
     result = await proxy.send_request("GET", "/store/inventory")
     
     assert result["status"] == "error"
-    assert "Simulated Chaos" in result["message"]
\ No newline at end of file
+    assert "Simulated Chaos" in result["message"]
+
+def test_chaos_proxy_error_codes_cached_across_instances(tmp_path):
+    """Proxies sharing a knowledge base parse it once and reload when it changes."""
+    kb = tmp_path / "codes.json"
+    kb.write_text(json.dumps({"503": "Service Unavailable"}), encoding="utf-8")
+
+    p1 = ChaosProxy(failure_rate=0.0, seed=1, mock_mode=True, error_codes_path=kb)
+    p2 = ChaosProxy(failure_rate=0.0, seed=2, mock_mode=True, error_codes_path=kb)
+    assert p1.error_codes is p2.error_codes
+
+    kb.write_text(json.dumps({"500": "Internal Server Error"}), encoding="utf-8")
+    stat = kb.stat()
+    os.utime(kb, (stat.st_atime, stat.st_mtime + 10))
+
+    p3 = ChaosProxy(failure_rate=0.0, seed=3, mock_mode=True, error_codes_path=kb)
+    assert p3.error_codes == {"500": "Internal Server Error"}
+
+@pytest.mark.asyncio
+async def test_chaos_proxy_real_mode_dispatches_params_and_body():
+    """GET envía solo params, POST solo el body JSON, por el mismo cliente reutilizado."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.params.get("status"), request.content))
+        return httpx.Response(200, json={"ok": True})
+
+    proxy = ChaosProxy(failure_rate=0.0, seed=1, mock_mode=False)
+    proxy._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    get_result = await proxy.send_request("GET", "/pet/findByStatus", params={"status": "available"})
+    post_result = await proxy.send_request("POST", "/store/order", json_body={"petId": 1})
+    bad_result = await proxy.send_request("TRACE", "/store/order")
+    await proxy.close()
+
+    assert get_result == {"status": "success", "code": 200, "data": {"ok": True}}
+    assert post_result["status"] == "success"
+    assert seen[0] == ("GET", "available", b"")
+    assert seen[1][0] == "POST" and seen[1][1] is None and b"petId" in seen[1][2]
+    assert bad_result["status"] == "error" and "Unsupported" in bad_result["message"]
+
+@pytest.mark.asyncio
+async def test_chaos_proxy_real_mode_maps_transport_failures():
+    """Timeout -> 408, JSON inválido -> 500; ambos como respuesta de error, sin excepción."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/slow"):
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, content=b"not json")
+
+    proxy = ChaosProxy(failure_rate=0.0, seed=1, mock_mode=False)
+    proxy._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    timeout_result = await proxy.send_request("GET", "/slow")
+    bad_json_result = await proxy.send_request("GET", "/store/inventory")
+    await proxy.close()
+
+    assert timeout_result["status"] == "error" and timeout_result["code"] == 408
+    assert bad_json_result["status"] == "error" and bad_json_result["code"] == 500
+    assert bad_json_result["message"].startswith("Invalid JSON response")
+
+@pytest.mark.asyncio
+async def test_chaos_proxy_real_mode_request_errors_are_not_json_errors():
+    """Un fallo al construir la petición no se etiqueta como JSON inválido."""
+    sent = []
+    proxy = ChaosProxy(failure_rate=0.0, seed=1, mock_mode=False)
+    proxy._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: sent.append(request) or httpx.Response(200))
+    )
+
+    # NaN is not valid JSON, so httpx rejects the body with a ValueError before sending
+    result = await proxy.send_request("POST", "/store/order", json_body={"id": 1, "price": float("nan")})
+    await proxy.close()
+
+    assert result["status"] == "error" and result["code"] == 500
+    assert result["message"].startswith("Invalid request")
+    assert sent == []
+
+@pytest.mark.asyncio
+async def test_chaos_proxy_only_injects_error_range_codes(tmp_path):
+    """Claves no numéricas o fuera de 4xx/5xx en la base de conocimiento se ignoran."""
+    kb = tmp_path / "mixed_codes.json"
+    kb.write_text(json.dumps({"_comment": "x", "200": "OK", "503": "Service Unavailable"}), encoding="utf-8")
+    proxy = ChaosProxy(failure_rate=1.0, seed=7, mock_mode=True, error_codes_path=kb)
+
+    results = [await proxy.send_request("GET", "/store/inventory") for _ in range(5)]
+
+    assert {r["code"] for r in results} == {503}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("verbose, level", [(True, logging.INFO), (False, logging.DEBUG)])
+async def test_chaos_proxy_call_logs_follow_verbose(caplog, verbose, level):
+    """Injected faults log at INFO for verbose proxies and at DEBUG otherwise."""
+    proxy = ChaosProxy(failure_rate=1.0, seed=1, mock_mode=True, verbose=verbose)
+
+    with caplog.at_level(logging.DEBUG, logger=proxy.logger.name):
+        await proxy.send_request("GET", "/store/inventory")
+
+    records = [r for r in caplog.records if r.getMessage().startswith("CHAOS INJECTED")]
+    assert [r.levelno for r in records] == [level]
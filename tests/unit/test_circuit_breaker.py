@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import time
 from typing import Any, Dict, List, Optional
 
@@ -308,3 +309,29 @@ async def test_circuit_opens_on_first_failure_with_threshold_one():
 
     assert cb._is_open is True
     assert cb._failures == 1
+
+
+
+# ---------------------------------------------------------------------------
+# 13. Blocked requests are warned about once per open period
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_blocked_requests_warn_once_per_open_period(caplog):
+    """The first rejection of an open period logs a WARNING, later ones DEBUG."""
+    cb = CircuitBreakerProxy(
+        wrapped_executor=MockExecutor([]),
+        failure_threshold=1,
+        cooldown_seconds=9999,
+    )
+    cb._is_open = True
+    cb._opened_timestamp = time.time()
+
+    with caplog.at_level(logging.DEBUG, logger="CircuitBreaker"):
+        for _ in range(3):
+            await cb.send_request("GET", "/api")
+        cb._opened_timestamp += 1  # circuit re-opened
+        await cb.send_request("GET", "/api")
+
+    levels = [r.levelno for r in caplog.records if r.getMessage().startswith("CIRCUIT OPEN")]
+    assert levels == [logging.WARNING, logging.DEBUG, logging.DEBUG, logging.WARNING]
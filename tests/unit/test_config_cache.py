@@ -0,0 +1,33 @@
+"""Tests for ConfigLoader's per-file parse cache."""
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import yaml
+
+from chaos_engine.core.config import ConfigLoader
+
+
+def test_config_loader_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    """El YAML se parsea una vez por mtime; cada llamada recibe su propia copia."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "x")
+
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    cfg_file = config_dir / "dev.yaml"
+    cfg_file.write_text("environment: dev\nagent:\n  model: model-a\n", encoding='utf-8')
+
+    loader = ConfigLoader(config_dir=config_dir)
+    with patch("chaos_engine.core.config.yaml.safe_load", wraps=yaml.safe_load) as parse:
+        first = loader.load("dev")
+        first["agent"]["model"] = "mutated"
+        second = loader.load("dev")
+        assert parse.call_count == 1
+        assert second["agent"]["model"] == "model-a"
+
+        cfg_file.write_text("environment: dev\nagent:\n  model: model-b\n", encoding='utf-8')
+        stat = cfg_file.stat()
+        os.utime(cfg_file, (stat.st_atime, stat.st_mtime + 10))
+        assert loader.load("dev")["agent"]["model"] == "model-b"
+        assert parse.call_count == 2
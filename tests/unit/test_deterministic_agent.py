@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 
 import pytest
 
+from chaos_engine.agents import deterministic
 from chaos_engine.agents.deterministic import DeterministicAgent
 
 
@@ -324,6 +325,29 @@ async def test_explicit_fail_fast_strategy_no_retry(tmp_path):
     assert executor.call_count == 1
 
 
+@pytest.mark.asyncio
+async def test_zero_retry_budget_fails_without_retrying(tmp_path):
+    """A retry strategy with max_retries=0 fails on the first error, no extra calls."""
+    playbook = {
+        "get_inventory": {
+            "500": {
+                "strategy": "retry_linear_backoff",
+                "config": {"delay": 1.0, "max_retries": 0},
+            }
+        }
+    }
+    playbook_path = _write_playbook(tmp_path, playbook)
+    executor = MockExecutor([FAILURE_500])
+    agent = DeterministicAgent(tool_executor=executor, playbook_path=playbook_path)
+
+    result = await agent.run()
+
+    assert result["status"] == "failure"
+    assert result["retries"] == 0
+    assert result["simulated_delay_s"] == 0.0
+    assert executor.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # 8. escalate_to_human strategy — behaves like fail_fast (no retry)
 # ---------------------------------------------------------------------------
@@ -378,3 +402,42 @@ async def test_missing_playbook_file_fails_gracefully(tmp_path):
     # Should not raise; fail_fast applies because playbook_data is {}
     assert result["status"] == "failure"
     assert result["retries"] == 0
+
+
+# ---------------------------------------------------------------------------
+# 11. Playbook parse is shared across agents until the file changes
+# ---------------------------------------------------------------------------
+
+def test_playbook_cached_across_agents_until_modified(tmp_path):
+    """Agents built from the same unchanged file share one parsed playbook."""
+    playbook_path = _write_playbook(tmp_path, {"default": {"strategy": "fail_fast", "config": {}}})
+    a1 = DeterministicAgent(tool_executor=MockExecutor([]), playbook_path=playbook_path)
+    a2 = DeterministicAgent(tool_executor=MockExecutor([]), playbook_path=playbook_path)
+    assert a1.playbook_data is a2.playbook_data
+    assert a1._strategy_index is a2._strategy_index
+
+    # Rewritten immediately, without bumping mtime: the size change is enough.
+    _write_playbook(tmp_path, {"default": {"strategy": "retry_linear_backoff", "config": {}}})
+
+    a3 = DeterministicAgent(tool_executor=MockExecutor([]), playbook_path=playbook_path)
+    assert a3.playbook_data["default"]["strategy"] == "retry_linear_backoff"
+    assert a3._strategy_index is not a1._strategy_index
+
+
+# ---------------------------------------------------------------------------
+# 12. Strategy index cache is bounded
+# ---------------------------------------------------------------------------
+
+def test_strategy_index_cache_is_bounded(tmp_path, monkeypatch):
+    """One index per playbook file, evicting the least recently used."""
+    monkeypatch.setattr(deterministic, "_STRATEGY_INDEX_CACHE", deterministic.OrderedDict())
+    monkeypatch.setattr(deterministic, "_STRATEGY_INDEX_CACHE_SIZE", 2)
+
+    paths = []
+    for i in range(3):
+        variant = tmp_path / f"v{i}"
+        variant.mkdir()
+        paths.append(_write_playbook(variant, {"default": {"strategy": "fail_fast", "config": {}}}))
+        DeterministicAgent(tool_executor=MockExecutor([]), playbook_path=paths[-1])
+
+    assert list(deterministic._STRATEGY_INDEX_CACHE) == paths[1:]
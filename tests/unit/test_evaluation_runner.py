@@ -0,0 +1,72 @@
+"""Tests for EvaluationRunner.run_suite — ordering under bounded concurrency."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Dict, List
+
+import pytest
+
+from chaos_engine.evaluation import runner as runner_module
+from chaos_engine.evaluation.runner import EvaluationRunner
+
+
+def _write_suite(tmp_path, n_cases: int) -> str:
+    suite = {
+        "name": "Ordering Suite",
+        "test_cases": [
+            {
+                "id": f"TC-{i:03d}",
+                "description": f"case {i}",
+                "input": f"Order-{i}",
+                "chaos_config": {"rate": 0.0, "seed": i},
+                "expected": {"status": "success"},
+            }
+            for i in range(n_cases)
+        ],
+    }
+    path = tmp_path / "suite.json"
+    path.write_text(json.dumps(suite), encoding="utf-8")
+    return str(path)
+
+
+def _make_runner(monkeypatch, max_concurrency: int) -> EvaluationRunner:
+    """Build a runner without config/agent wiring; cases are faked below."""
+    monkeypatch.setattr(runner_module, "Gemini", lambda **kwargs: object())
+    runner = EvaluationRunner.__new__(EvaluationRunner)
+    runner.logger = logging.getLogger("evaluator")
+    runner.model_name = "test-model"
+    runner.mock_mode = True
+    runner.max_concurrency = max_concurrency
+
+    async def _fake_case(case: Dict, llm=None) -> runner_module.TestResult:
+        seed = case["chaos_config"]["seed"]
+        # Later cases finish first, so completion order differs from suite order.
+        await asyncio.sleep(0.001 * (10 - seed))
+        return runner_module.TestResult(case["id"], seed % 2 == 0, f"seed {seed}", 0.0, {"seed": seed})
+
+    runner._run_single_case = _fake_case
+    return runner
+
+
+def test_default_runs_cases_sequentially(monkeypatch):
+    monkeypatch.setattr(runner_module, "load_config", lambda: {"mock_mode": True})
+    monkeypatch.setattr(runner_module, "get_model_name", lambda config: "test-model")
+    monkeypatch.setattr(runner_module, "PetstoreAgent", lambda **kwargs: object())
+
+    assert EvaluationRunner(agent_playbook="unused.json").max_concurrency == 1
+
+
+@pytest.mark.asyncio
+async def test_results_keep_suite_order_regardless_of_concurrency(tmp_path, monkeypatch):
+    suite_path = _write_suite(tmp_path, 8)
+
+    results: List[List[runner_module.TestResult]] = []
+    for max_concurrency in (1, 4):
+        runner = _make_runner(monkeypatch, max_concurrency)
+        results.append(await runner.run_suite(suite_path))
+
+    sequential, concurrent = results
+    assert [r.case_id for r in sequential] == [f"TC-{i:03d}" for i in range(8)]
+    assert concurrent == sequential
@@ -1,12 +1,14 @@
 """Tests for PlaybookStorage — JSON strategy matrix with hot-reload."""
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
 import pytest
 
 from chaos_engine.core.playbook_storage import PlaybookStorage
+from chaos_engine.tools.playbook_tools import add_scenario_to_playbook
 
 
 # --- FIXTURES ---
@@ -131,3 +133,55 @@ async def test_hot_reload_detects_file_change(temp_storage_file):
 
     cached = await storage.get_cached_playbook()
     assert "external_update" in cached
+
+
+@pytest.mark.asyncio
+async def test_resolve_strategy_served_from_cache(temp_storage_file, monkeypatch):
+    """Repeated lookups must not re-read the file; writes refresh the cache."""
+    storage = PlaybookStorage(file_path=temp_storage_file)
+    await storage.add_or_update_strategy(
+        api="get_inventory", status_code="503", strategy="wait_and_retry",
+    )
+
+    reads = []
+    original = storage._read_playbook_sync
+    monkeypatch.setattr(storage, "_read_playbook_sync", lambda: reads.append(1) or original())
+
+    for _ in range(5):
+        resolved = await storage.resolve_strategy("get_inventory", "503")
+        assert resolved["strategy"] == "wait_and_retry"
+    assert reads == []
+
+    await storage.remove_strategy("get_inventory", "503")
+    assert await storage.resolve_strategy("get_inventory", "503") is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_strategy_with_missing_file(temp_storage_file):
+    """A deleted playbook file resolves to no strategy instead of raising."""
+    storage = PlaybookStorage(file_path=temp_storage_file)
+    Path(temp_storage_file).unlink()
+
+    assert await storage.resolve_strategy("get_inventory", "500") is None
+    assert await storage.get_cached_playbook() == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_are_not_lost(temp_storage_file):
+    """Concurrent read-modify-write calls must all land on disk."""
+    storage = PlaybookStorage(file_path=temp_storage_file)
+
+    await asyncio.gather(*(
+        storage.add_or_update_strategy(api=f"api{i}", status_code="500", strategy="fail_fast")
+        for i in range(5)
+    ))
+    await asyncio.gather(*(
+        add_scenario_to_playbook(storage, "place_order", code, {"strategy": "wait_and_retry"})
+        for code in (429, 503, 504)
+    ))
+
+    with open(temp_storage_file, "r") as f:
+        data = json.load(f)
+    assert set(data) == {"api0", "api1", "api2", "api3", "api4", "place_order"}
+    assert set(data["place_order"]) == {"429", "503", "504"}
+    assert await storage.get_cached_playbook() == data
@@ -0,0 +1,65 @@
+"""Tests for the JSON decoding helpers — same results with or without orjson."""
+from __future__ import annotations
+
+import json
+import math
+import os
+
+import pytest
+
+from chaos_engine.core import serialization
+from chaos_engine.core.serialization import load_file, load_file_cached, loads
+
+
+def test_loads_accepts_bytes_and_text():
+    assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_loads_accepts_non_finite_literals():
+    """json accepts NaN/Infinity; the orjson fast path must not change that."""
+    data = loads('{"nan": NaN, "inf": Infinity}')
+    assert math.isnan(data["nan"])
+    assert data["inf"] == math.inf
+
+
+def test_loads_accepts_big_integers():
+    big = 2 ** 70
+    assert loads(f'{{"n": {big}}}') == {"n": big}
+
+
+def test_loads_raises_json_decode_error_on_malformed_input():
+    with pytest.raises(json.JSONDecodeError):
+        loads(b'{"a": ')
+
+
+def test_load_file_round_trip(tmp_path):
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps({"k": "v"}), encoding="utf-8")
+    assert load_file(path) == {"k": "v"}
+
+
+def test_load_file_cached_sees_same_tick_rewrite(tmp_path):
+    """A rewrite that keeps the mtime but changes the size is not served stale."""
+    path = tmp_path / "doc.json"
+    path.write_text('{"k": 1}', encoding="utf-8")
+    first = load_file_cached(path)
+    assert load_file_cached(path) is first
+
+    stat = path.stat()
+    path.write_text('{"k": 100}', encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_file_cached(path) == {"k": 100}
+
+
+def test_load_file_cached_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(serialization, "_FILE_CACHE", serialization.OrderedDict())
+    monkeypatch.setattr(serialization, "_FILE_CACHE_SIZE", 2)
+
+    paths = []
+    for i in range(3):
+        paths.append(tmp_path / f"v{i}.json")
+        paths[-1].write_text(json.dumps({"v": i}), encoding="utf-8")
+        load_file_cached(paths[-1])
+
+    assert list(serialization._FILE_CACHE) == [p.resolve() for p in paths[1:]]